@@ -1,25 +1,48 @@
 import httpx
 import logging
-import os
-import json
+import orjson
+import random
 from typing import Any, Dict, Optional
 
+from .transport import SharedAsyncClient
+
 logger = logging.getLogger(__name__)
 
 class MetabolicInterceptor:
-    def __init__(self, transaction_skill=None):
+    # Shared across interceptors so the 402 probe, the payment retry and later
+    # calls to the same origin reuse pooled keep-alive connections.
+    _pool = SharedAsyncClient(
+        http2=True,
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30),
+        timeout=httpx.Timeout(10.0, connect=5.0, read=15.0, write=5.0, pool=5.0),
+    )
+
+    def __init__(self, transaction_skill=None, session: Optional[httpx.AsyncClient] = None):
         """
         Initializes the interceptor.
         :param transaction_skill: An instance of TransactionSkill from aura-core for processing payments.
+        :param session: Optional caller-owned AsyncClient; defaults to the shared pool.
         """
         self.transaction_skill = transaction_skill
-        self.client = httpx.AsyncClient()
+        self.session = session
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        if self.session is not None:
+            return self.session
+        return await self._pool.get()
+
+    @classmethod
+    async def aclose(cls):
+        """Closes the shared AsyncClient. Call once at shutdown."""
+        await cls._pool.aclose()
 
     async def request_with_payment(self, method: str, url: str, **kwargs) -> httpx.Response:
         """
         Executes an HTTP request, intercepting 402 Payment Required responses to perform the x402 flow.
         """
-        response = await self.client.request(method, url, **kwargs)
+        client = await self._get_client()
+        response = await client.request(method, url, **kwargs)
 
         if response.status_code == 402:
                 logger.info("🧬 [Metabolic Interceptor] 402 Payment Required detected. Initiating Foraging Flow.")
@@ -33,13 +56,16 @@ class MetabolicInterceptor:
                 try:
                     # Instructions might be JSON or a simple string
                     # Directive says: "send the specified USDC on Base Sepolia"
-                    instr = json.loads(payment_instructions)
-                except json.JSONDecodeError:
+                    instr = orjson.loads(payment_instructions)
+                except orjson.JSONDecodeError:
                     logger.error("Failed to parse X-Payment-Instructions as JSON. Aborting payment.")
                     return response
 
                 # 2. Process payment via TransactionSkill
-                logger.info(f"Processing payment of {instr.get('amount')} {instr.get('currency')} to {instr.get('destination')} on {instr.get('network')}...")
+                logger.info(
+                    "Processing payment of %s %s to %s on %s...",
+                    instr.get("amount"), instr.get("currency"), instr.get("destination"), instr.get("network"),
+                )
 
                 tx_hash = await self._process_payment(instr)
 
@@ -47,14 +73,11 @@ class MetabolicInterceptor:
                     logger.error("Payment failed. Cannot retry request.")
                     return response
 
-                logger.info(f"Payment successful. TX Hash: {tx_hash}. Retrying request with proof.")
+                logger.info("Payment successful. TX Hash: %s. Retrying request with proof.", tx_hash)
 
                 # 3. Retry with payment proof
-                headers = kwargs.get("headers", {}).copy()
-                headers["X-Payment-Proof"] = tx_hash
-                kwargs["headers"] = headers
-
-                return await self.client.request(method, url, **kwargs)
+                headers = {**(kwargs.pop("headers", None) or {}), "X-Payment-Proof": tx_hash}
+                return await client.request(method, url, headers=headers, **kwargs)
 
         return response
 
@@ -64,7 +87,7 @@ class MetabolicInterceptor:
         """
         if not self.transaction_skill:
             logger.warning("TransactionSkill not initialized. Using simulated proof for development.")
-            return f"0x_simulated_proof_{os.urandom(4).hex()}"
+            return f"0x_simulated_proof_{random.getrandbits(32):08x}"
 
         try:
             # Assuming TransactionSkill has a method to handle this
@@ -78,5 +101,5 @@ class MetabolicInterceptor:
             # For now, we simulate the interaction based on SSA's directive
             return "0x_base_sepolia_transaction_hash"
         except Exception as e:
-            logger.error(f"TransactionSkill execution failed: {e}", exc_info=True)
+            logger.error("TransactionSkill execution failed: %s", e, exc_info=True)
             return None
@@ -1,51 +1,217 @@
+import asyncio
+import base64
+import hashlib
 import os
+import pathlib
+import tempfile
 import httpx
+import orjson
 import logging
 import time
-from typing import Optional
+from typing import ClassVar, Dict, Optional
+
+from ..transport import SharedAsyncClient
 
 logger = logging.getLogger(__name__)
 
+def _jwt_exp(token: str) -> Optional[float]:
+    """Returns the `exp` claim of a JWT identity token, or None if the token isn't a JWT."""
+    try:
+        payload = token.split(".")[1]
+        claims = orjson.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+def _token_cache_path() -> Optional[pathlib.Path]:
+    """Returns the token cache file, or None (persistence off) if there is no usable home directory."""
+    try:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+    except (RuntimeError, KeyError, OSError) as e:
+        # e.g. an arbitrary container UID with no HOME and no passwd entry
+        logger.warning("No home directory for the Moltbook token cache (%s). Token persistence disabled.", e)
+        return None
+    return pathlib.Path(cache_home) / "aura" / "moltbook_token.json"
+
 class MoltbookClient:
-    def __init__(self):
+    # Shared across clients so token refreshes and pheromone posts reuse
+    # pooled keep-alive connections instead of a new TLS handshake each time.
+    _pool = SharedAsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30),
+        timeout=httpx.Timeout(10.0, connect=5.0, read=15.0, write=5.0, pool=5.0),
+    )
+    # Refresh this many seconds before the token actually expires (at most half its lifetime)
+    TOKEN_REFRESH_SKEW = 300
+    # Tokens live for 1 hour as per SSA, unless the server says otherwise
+    DEFAULT_TOKEN_TTL = 3600
+    SHORT_TOKEN_TTL_WARNING = 120
+
+    # The identity token is shared by every client in the process; the lock makes
+    # concurrent callers with an expired token wait on a single refresh.
+    _identity_token: ClassVar[Optional[str]] = None
+    # Hash of the API key that minted _identity_token; a client with another key must not reuse it
+    _token_key_id: ClassVar[Optional[str]] = None
+    # On the monotonic clock, so NTP steps can't make a live token look expired (or vice versa)
+    _token_expiry: ClassVar[float] = 0
+    _token_skew: ClassVar[float] = TOKEN_REFRESH_SKEW
+    _signal_headers: ClassVar[Dict[str, str]] = {}
+    _token_lock: ClassVar[Optional[asyncio.Lock]] = None
+    _token_lock_loop: ClassVar[Optional[asyncio.AbstractEventLoop]] = None
+
+    def __init__(self, session: Optional[httpx.AsyncClient] = None):
         self.api_url = "https://moltbook.zae.life/api/v1"
+        self._token_url = f"{self.api_url}/me/identity-token"
+        self._signal_url = f"{self.api_url}/submolt/lablab/post"
         self.api_key = os.environ.get("MOLTBOOK_API_KEY")
-        self.identity_token: Optional[str] = None
-        self.token_expiry: float = 0
-        self.client = httpx.AsyncClient()
+        # Callers check this before building a pheromone, so dev runs without a key skip the work
+        self.enabled = bool(self.api_key)
+        if not self.enabled:
+            logger.warning("MOLTBOOK_API_KEY not set. Pheromone signaling disabled.")
+        # Fixed per client; the signal headers are rebuilt only when the token changes
+        self._auth_headers = {"Authorization": f"Bearer {self.api_key}"}
+        # The token is tied to the key that minted it, in memory and in the user cache that
+        # lets it survive process restarts
+        self._token_cache_path = _token_cache_path() if self.enabled else None
+        self._key_id = hashlib.sha256(self.api_key.encode()).hexdigest()[:16] if self.enabled else None
+        if self._token_cache_path is not None and not self._cached_token():
+            self._load_persisted_token()
+        # Caller-owned AsyncClient, if one was injected; otherwise the shared pool is used
+        self.session = session
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        if self.session is not None:
+            return self.session
+        return await self._pool.get()
+
+    @classmethod
+    async def aclose(cls):
+        """Closes the shared AsyncClient. Call once at shutdown."""
+        await cls._pool.aclose()
 
     async def get_identity_token(self) -> Optional[str]:
         """
         Step 1 & 2: Activation and Expression.
-        Fetches a 1-hour identity token using the API key.
+        Fetches an identity token using the API key, cached until shortly before it expires.
         """
         if not self.api_key:
             logger.error("MOLTBOOK_API_KEY not set.")
             return None
 
-        # Metabolic Refresh check
-        if self.identity_token and time.time() < self.token_expiry - 60:
-            return self.identity_token
+        # Metabolic Refresh check: lock-free fast path, then re-check under the lock
+        token = self._cached_token()
+        if token:
+            return token
+
+        async with self._get_token_lock():
+            token = self._cached_token()
+            if token:
+                return token
+            return await self._refresh_identity_token()
+
+    @classmethod
+    def _get_token_lock(cls) -> asyncio.Lock:
+        # Created per event loop, like the shared client: an asyncio.Lock can't be awaited across loops
+        loop = asyncio.get_running_loop()
+        if cls._token_lock is None or cls._token_lock_loop is not loop:
+            cls._token_lock, cls._token_lock_loop = asyncio.Lock(), loop
+        return cls._token_lock
 
+    def _cached_token(self) -> Optional[str]:
+        cls = type(self)
+        if (
+            cls._identity_token
+            and cls._token_key_id == self._key_id
+            and time.monotonic() < cls._token_expiry - cls._token_skew
+        ):
+            return cls._identity_token
+        return None
+
+    async def _refresh_identity_token(self) -> Optional[str]:
+        cls = type(self)
         logger.info("🧬 [Moltbook Client] Refreshing Identity Token...")
-        headers = {"Authorization": f"Bearer {self.api_key}"}
 
         try:
-            response = await self.client.post(f"{self.api_url}/me/identity-token", headers=headers)
+            client = await self._get_client()
+            response = await client.post(self._token_url, headers=self._auth_headers)
             response.raise_for_status()
-            data = response.json()
-            self.identity_token = data.get("identity_token")
-            # Tokens live for 1 hour as per SSA
-            self.token_expiry = time.time() + 3600
+            data = orjson.loads(response.content)
+            cls._identity_token = data.get("identity_token")
+            cls._token_key_id = self._key_id
+            cls._signal_headers = {
+                "X-Moltbook-Identity": cls._identity_token,
+                "Content-Type": "application/json"
+            }
+            ttl = self._token_ttl(data, cls._identity_token)
+            cls._token_expiry = time.monotonic() + ttl
+            cls._token_skew = min(self.TOKEN_REFRESH_SKEW, ttl / 2)
             logger.info("Identity token successfully expressed.")
-            return self.identity_token
+            self._persist_token(cls._identity_token, time.time() + ttl)
+            return cls._identity_token
         except httpx.HTTPError as e:
-            logger.error(f"Failed to fetch identity token: {e}", exc_info=True)
+            logger.error("Failed to fetch identity token: %s", e, exc_info=True)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error fetching identity token: {e}", exc_info=True)
+            logger.error("Unexpected error fetching identity token: %s", e, exc_info=True)
             return None
 
+    def _load_persisted_token(self):
+        try:
+            cached = orjson.loads(self._token_cache_path.read_bytes())
+            token, expiry = cached["token"], float(cached["expiry"])
+        except FileNotFoundError:
+            return
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.warning("Ignoring unreadable Moltbook token cache %s: %s", self._token_cache_path, e)
+            return
+        # The file holds a wall-clock expiry (monotonic time doesn't survive a restart)
+        remaining = expiry - time.time()
+        if cached.get("key_id") != self._key_id or not token or remaining <= self.TOKEN_REFRESH_SKEW:
+            return
+
+        cls = type(self)
+        cls._identity_token = token
+        cls._token_key_id = self._key_id
+        cls._signal_headers = {
+            "X-Moltbook-Identity": token,
+            "Content-Type": "application/json"
+        }
+        cls._token_expiry = time.monotonic() + remaining
+        cls._token_skew = self.TOKEN_REFRESH_SKEW
+        logger.info("Identity token restored from %s.", self._token_cache_path)
+
+    def _persist_token(self, token: Optional[str], expires_at: float):
+        """Writes the token atomically, readable only by the current user. Failures are non-fatal."""
+        path = self._token_cache_path
+        if not token or path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # mkstemp creates the file with 0o600
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(orjson.dumps({"token": token, "expiry": expires_at, "key_id": self._key_id}))
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError as e:
+            logger.warning("Could not persist Moltbook token cache to %s: %s", path, e)
+
+    @classmethod
+    def _token_ttl(cls, data: Dict, token: Optional[str]) -> float:
+        """Token lifetime in seconds: `expires_in`, else the JWT `exp` claim, else DEFAULT_TOKEN_TTL."""
+        ttl = data.get("expires_in")
+        if ttl is None and token:
+            exp = _jwt_exp(token)
+            if exp is not None:
+                ttl = exp - time.time()
+        ttl = float(cls.DEFAULT_TOKEN_TTL if ttl is None else ttl)
+        if ttl < cls.SHORT_TOKEN_TTL_WARNING:
+            logger.warning("Moltbook identity token lives only %.0fs. Check the server's token TTL.", ttl)
+        return ttl
+
     async def emit_pheromone(self, content: str) -> bool:
         """
         Step 3: Signaling.
@@ -56,24 +222,21 @@ class MoltbookClient:
             logger.error("No valid identity token available. Signaling aborted.")
             return False
 
-        headers = {
-            "X-Moltbook-Identity": token,
-            "Content-Type": "application/json"
-        }
-
-        payload = {
+        # Serialized up front; Content-Type is already on the signal headers
+        payload = orjson.dumps({
             "content": content,
             "origin": "bee.savant"
-        }
+        })
 
         try:
-            response = await self.client.post(f"{self.api_url}/submolt/lablab/post", json=payload, headers=headers)
+            client = await self._get_client()
+            response = await client.post(self._signal_url, content=payload, headers=self._signal_headers)
             response.raise_for_status()
             logger.info("Pheromone successfully signaled to lablab submolt.")
             return True
         except httpx.HTTPError as e:
-            logger.error(f"HTTP error during signaling: {e}", exc_info=True)
+            logger.error("HTTP error during signaling: %s", e, exc_info=True)
             return False
         except Exception as e:
-            logger.error(f"Unexpected error during signaling: {e}", exc_info=True)
+            logger.error("Unexpected error during signaling: %s", e, exc_info=True)
             return False
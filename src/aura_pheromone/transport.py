@@ -0,0 +1,35 @@
+import asyncio
+import httpx
+from typing import Any, Optional
+
+
+class SharedAsyncClient:
+    """
+    Holds one lazily-created httpx.AsyncClient so repeated calls reuse pooled
+    keep-alive connections instead of paying a TCP + TLS handshake each time.
+    The client is rebuilt if the running event loop changes, since httpx
+    connections cannot be reused across loops.
+    """
+
+    def __init__(self, **client_kwargs: Any):
+        self._client_kwargs = client_kwargs
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def get(self) -> httpx.AsyncClient:
+        """Returns the shared client, creating it on first use (or after aclose / a loop change)."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            # A client bound to a previous (closed) loop is dropped, not closed: its
+            # transports died with that loop.
+            self._client = httpx.AsyncClient(**self._client_kwargs)
+            self._loop = loop
+        return self._client
+
+    async def aclose(self):
+        """Closes the shared client. Call once at shutdown."""
+        if self._client is not None:
+            if self._loop is asyncio.get_running_loop():
+                await self._client.aclose()
+            self._client = None
+            self._loop = None
@@ -1,16 +1,35 @@
+import asyncio
 import os
 import logging
-import httpx
-from typing import Any, Dict
+import time
+from typing import Any, Dict, List, Sequence
 from aura_worker import Umbilical, WorkerController, VisionSkill
 
+from .transport import SharedAsyncClient
+
 logger = logging.getLogger(__name__)
 
 class VisionCortex:
+    # Heartbeats reuse one keep-alive connection to the tunnelled Ollama endpoint
+    _pool = SharedAsyncClient(timeout=5.0)
+    # A healthy heartbeat is trusted for this long before the next ping
+    VITALS_TTL = 30.0
+    # Circuit breaker: after this many consecutive transport failures (failed heartbeats or
+    # generate() exceptions), fail fast for CIRCUIT_COOLDOWN seconds; after the cooldown a
+    # single failure reopens it
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    CIRCUIT_COOLDOWN = 30.0
+    # verify_assets keeps at most this many generate() calls in flight over the tunnel
+    MAX_CONCURRENT_PERCEPTIONS = 4
+
     def __init__(self):
         self.controller = WorkerController()
         self.skill = None
         self._initialized = False
+        # monotonic() has no defined zero (it may be < VITALS_TTL right after boot), so "never" is -inf
+        self._last_vitals_ok_at: float = float("-inf")
+        self._fail_count = 0
+        self._open_until: float = 0
 
     async def initialize(self):
         punk_key = os.environ.get("AURA_WORKER__PUNK_KEY")
@@ -50,29 +69,96 @@ class VisionCortex:
 
         # 2. Heartbeat check to Ollama via tunnel
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get("http://localhost:11434/api/tags")
-                response.raise_for_status()
+            client = await self._pool.get()
+            response = await client.get("http://localhost:11434/api/tags")
+            response.raise_for_status()
         except Exception as e:
-            logger.error(f"Heartbeat failed: {e}")
+            logger.error("Heartbeat failed: %s", e)
             return {"status": "VITALS_STATUS_ERROR", "error": str(e)}
 
         return {"status": "VITALS_STATUS_OK"}
 
+    @classmethod
+    async def aclose(cls):
+        """Closes the shared heartbeat client. Call once at shutdown."""
+        await cls._pool.aclose()
+
     async def ensure_active(self):
+        if self._initialized and time.monotonic() - self._last_vitals_ok_at < self.VITALS_TTL:
+            return True
+        return await self._slow_ensure_active()
+
+    async def _slow_ensure_active(self):
+        # ping() initializes the cortex on first use
         vitals = await self.ping()
         if vitals["status"] != "VITALS_STATUS_OK":
+             self._record_failure()
              raise ConnectionError(f"VisionCortex inactive: {vitals.get('error')}")
+        self._last_vitals_ok_at = time.monotonic()
         return True
 
-    async def verify_asset(self, image_data: bytes | str):
+    async def verify_asset(self, image_data: bytes | str) -> Dict[str, Any]:
+        self._check_circuit()
+        # Fast path inlined: one attribute check, one compare, then straight to generate
+        if not self._initialized or time.monotonic() - self._last_vitals_ok_at >= self.VITALS_TTL:
+            await self._slow_ensure_active()
+        return await self._perceive(image_data)
+
+    async def verify_assets(self, images: Sequence[bytes | str]) -> List[Dict[str, Any] | Exception]:
+        """
+        Perceives several images behind a single vitals check.
+        Each image is still its own generate() call (a multi-image generate is one
+        prompt, not N perceptions); up to MAX_CONCURRENT_PERCEPTIONS of them share
+        the tunnel at a time.
+        Results are per image: a failed perception is returned as its exception so
+        it doesn't discard the others. A failed vitals check still raises.
+        """
+        self._check_circuit()
         await self.ensure_active()
+        slots = asyncio.Semaphore(self.MAX_CONCURRENT_PERCEPTIONS)
+
+        async def perceive(image):
+            async with slots:
+                return await self._perceive(image)
+
+        results = await asyncio.gather(*(perceive(image) for image in images), return_exceptions=True)
+        for result in results:
+            # Only perception errors are per-image; cancellation and the like still propagate
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+        return results
 
+    async def _perceive(self, image_data: bytes | str) -> Dict[str, Any]:
         # The VisionSkill in aura-worker uses 'generate' method
         # We wrap it to match the perception needs
-        result = await self.skill.generate([image_data])
+        try:
+            result = await self.skill.generate([image_data])
+        except Exception:
+            # Don't trust the cached vitals after a failure; re-ping on the next call
+            self._last_vitals_ok_at = float("-inf")
+            self._record_failure()
+            raise
 
+        # A per-image error result means the tunnel answered, so it doesn't count toward the breaker
         if "error" in result:
+             self._last_vitals_ok_at = float("-inf")
              raise ValueError(f"Vision perception failed: {result['error']}")
 
+        self._fail_count = 0
         return result
+
+    def _check_circuit(self):
+        # Checked before the vitals ping too, so an open circuit doesn't cost a heartbeat timeout either
+        if time.monotonic() < self._open_until:
+            raise ConnectionError("vision circuit open")
+
+    def _record_failure(self):
+        self._fail_count += 1
+        if self._fail_count >= self.CIRCUIT_FAILURE_THRESHOLD:
+            logger.error(
+                "VisionCortex failed %d times in a row; opening circuit for %.0fs.",
+                self._fail_count, self.CIRCUIT_COOLDOWN,
+            )
+            self._open_until = time.monotonic() + self.CIRCUIT_COOLDOWN
+            # The count stays at the threshold (half-open): only a success closes the circuit
+            self._fail_count = self.CIRCUIT_FAILURE_THRESHOLD
@@ -0,0 +1,117 @@
+import asyncio
+import os
+import stat
+import tempfile
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+from aura_pheromone.synapses.moltbook import MoltbookClient
+
+class TestMoltbookClient(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._reset_token_cache()
+        # Keep the persisted token cache out of the real ~/.cache
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.env = {"MOLTBOOK_API_KEY": "key", "XDG_CACHE_HOME": cache_dir.name}
+
+    def _reset_token_cache(self):
+        # The identity token cache is process-wide; start every test cold
+        MoltbookClient._identity_token = None
+        MoltbookClient._token_key_id = None
+        MoltbookClient._token_expiry = 0
+        MoltbookClient._token_skew = MoltbookClient.TOKEN_REFRESH_SKEW
+        MoltbookClient._signal_headers = {}
+
+    def _mock_http(self, payload: bytes):
+        response = MagicMock()
+        response.content = payload
+
+        async def post(*args, **kwargs):
+            await asyncio.sleep(0)  # yield so concurrent callers overlap with the refresh
+            return response
+
+        http = MagicMock()
+        http.post = AsyncMock(side_effect=post)
+        return http
+
+    async def test_concurrent_callers_share_one_token_refresh(self):
+        http = self._mock_http(b'{"identity_token": "tok"}')
+
+        with patch("os.environ", self.env):
+            clients = [MoltbookClient() for _ in range(5)]
+        with patch.object(MoltbookClient, "_get_client", AsyncMock(return_value=http)):
+            tokens = await asyncio.gather(*(c.get_identity_token() for c in clients))
+
+        self.assertEqual(tokens, ["tok"] * 5)
+        self.assertEqual(http.post.call_count, 1)
+
+    async def test_token_expiry_follows_server_ttl(self):
+        http = self._mock_http(b'{"identity_token": "tok", "expires_in": 600}')
+
+        with patch("os.environ", self.env):
+            client = MoltbookClient()
+        with patch.object(MoltbookClient, "_get_client", AsyncMock(return_value=http)):
+            await client.get_identity_token()
+
+        self.assertAlmostEqual(MoltbookClient._token_expiry - time.monotonic(), 600, delta=5)
+        self.assertEqual(MoltbookClient._token_skew, 300)
+
+    async def test_concurrent_pheromones_share_one_token_refresh(self):
+        http = self._mock_http(b'{"identity_token": "tok"}')
+
+        with patch("os.environ", self.env):
+            client = MoltbookClient()
+        with patch.object(MoltbookClient, "_get_client", AsyncMock(return_value=http)):
+            results = await asyncio.gather(*(client.emit_pheromone(f"signal {i}") for i in range(3)))
+
+        self.assertEqual(results, [True] * 3)
+        # One token refresh, then one post per pheromone
+        self.assertEqual(http.post.call_count, 4)
+
+    async def test_token_is_restored_from_disk_cache(self):
+        http = self._mock_http(b'{"identity_token": "tok"}')
+
+        with patch("os.environ", self.env):
+            client = MoltbookClient()
+        with patch.object(MoltbookClient, "_get_client", AsyncMock(return_value=http)):
+            await client.get_identity_token()
+        self.assertEqual(stat.S_IMODE(os.stat(client._token_cache_path).st_mode), 0o600)
+
+        # Simulate a process restart
+        self._reset_token_cache()
+        with patch("os.environ", self.env):
+            restarted = MoltbookClient()
+        with patch.object(MoltbookClient, "_get_client", AsyncMock(return_value=http)):
+            self.assertEqual(await restarted.get_identity_token(), "tok")
+        self.assertEqual(http.post.call_count, 1)
+
+    async def test_token_is_not_shared_across_api_keys(self):
+        http = self._mock_http(b'{"identity_token": "tok"}')
+
+        with patch("os.environ", self.env):
+            client = MoltbookClient()
+        with patch("os.environ", {**self.env, "MOLTBOOK_API_KEY": "other-key"}):
+            other = MoltbookClient()
+        with patch.object(MoltbookClient, "_get_client", AsyncMock(return_value=http)):
+            await client.get_identity_token()
+            await other.get_identity_token()
+
+        self.assertEqual(http.post.call_count, 2)
+        self.assertEqual(http.post.call_args.kwargs["headers"], {"Authorization": "Bearer other-key"})
+
+    async def test_missing_home_directory_disables_token_persistence(self):
+        http = self._mock_http(b'{"identity_token": "tok"}')
+
+        with patch("os.environ", {"MOLTBOOK_API_KEY": "key"}), \
+                patch("pathlib.Path.home", side_effect=RuntimeError("Could not determine home directory")):
+            client = MoltbookClient()
+            with patch("os.environ", {}):
+                self.assertFalse(MoltbookClient().enabled)
+        with patch.object(MoltbookClient, "_get_client", AsyncMock(return_value=http)):
+            self.assertEqual(await client.get_identity_token(), "tok")
+
+        self.assertIsNone(client._token_cache_path)
+
+if __name__ == "__main__":
+    unittest.main()
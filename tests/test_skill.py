@@ -1,7 +1,8 @@
 import asyncio
+import httpx
 import unittest
 from unittest.mock import patch, MagicMock
-from aura_pheromone.skill import AromaticOracleSkill
+from aura_pheromone.skill import AromaticOracleSkill, _parse_repo
 
 class TestAromaticOracle(unittest.IsolatedAsyncioTestCase):
     @patch("aura_pheromone.vision.VisionCortex.ping")
@@ -26,6 +27,19 @@ class TestAromaticOracle(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result["metadata"]["confidence_score"], "0.98")
         mock_emit.assert_called_once()
 
+    @patch("aura_pheromone.vision.VisionCortex.verify_assets")
+    @patch("aura_pheromone.skill.AromaticOracleSkill._emit_pheromone")
+    async def test_verify_assets_quality_reports_each_image(self, mock_emit, mock_verify):
+        mock_verify.return_value = [{"make": "Honda"}, ValueError("Vision perception failed: blurry")]
+
+        skill = AromaticOracleSkill()
+        results = await skill.verify_assets_quality(["img-1", "img-2"])
+        await skill.flush()
+
+        self.assertEqual(results[0]["vehicle"]["make"], "Honda")
+        self.assertEqual(results[1], {"image_source": "img-2", "error": "Vision perception failed: blurry"})
+        mock_emit.assert_called_once()
+
     @patch("aura_pheromone.skill.AromaticOracleSkill._fetch_repo_data")
     @patch("aura_pheromone.metabolism.MetabolicInterceptor.request_with_payment")
     @patch("aura_pheromone.skill.AromaticOracleSkill._emit_pheromone")
@@ -37,9 +51,9 @@ class TestAromaticOracle(unittest.IsolatedAsyncioTestCase):
         mock_response.status_code = 200
         mock_request.return_value = mock_response
 
-        skill = AromaticOracleSkill()
         # Ensure energy is present
         with patch("os.environ", {"WALLET_PRIVATE_KEY": "0x123"}):
+            skill = AromaticOracleSkill()
             result = await skill.appraise_honey_code("https://github.com/user/trenchchat")
 
         self.assertIn("SURGE", result["recommended_protocol_value"])
@@ -47,5 +61,116 @@ class TestAromaticOracle(unittest.IsolatedAsyncioTestCase):
         self.assertGreater(result["affinity"], 0.5)
         self.assertEqual(mock_request.call_count, 1) # GoldRush Foraging triggered
 
+    @patch("aura_pheromone.skill.AromaticOracleSkill._fetch_repo_data")
+    @patch("aura_pheromone.metabolism.MetabolicInterceptor.request_with_payment")
+    @patch("aura_pheromone.skill.AromaticOracleSkill._emit_pheromone")
+    async def test_appraise_honey_code_without_energy(self, mock_emit, mock_request, mock_fetch):
+        mock_fetch.side_effect = ValueError("Invalid GitHub repository URL")
+
+        with patch("os.environ", {}):
+            skill = AromaticOracleSkill()
+            with self.assertRaises(ConnectionError):
+                await skill.appraise_honey_code("https://github.com/user")
+
+        mock_emit.assert_not_called()
+        # GoldRush Foraging may pay via x402, so it must not start before the repo fetch settles
+        mock_request.assert_not_called()
+
+    @patch("aura_pheromone.skill.AromaticOracleSkill._request_repo_data")
+    async def test_fetch_repo_data_is_cached(self, mock_request):
+        response = MagicMock()
+        response.status_code = 200
+        response.content = b'{"stargazers_count": 10, "size": 100}'
+        response.headers = {"ETag": '"abc"', "Cache-Control": "private, max-age=60"}
+        mock_request.return_value = response
+
+        skill = AromaticOracleSkill()
+        results = await asyncio.gather(
+            *(skill._fetch_repo_data("https://github.com/user/repo") for _ in range(3))
+        )
+        await skill._fetch_repo_data("https://github.com/user/repo/tree/main")
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertTrue(all(r == {"stargazers_count": 10, "size": 100} for r in results))
+
+    @patch("aura_pheromone.skill.AromaticOracleSkill._request_repo_data")
+    async def test_fetch_repo_data_stays_single_flight_after_a_failure(self, mock_request):
+        response = MagicMock(status_code=200, content=b'{"size": 100}', headers={})
+        retry_started, finish_retry = asyncio.Event(), asyncio.Event()
+
+        async def request(api_url, etag=None):
+            if mock_request.call_count == 1:
+                await asyncio.sleep(0)  # let the waiter queue up on the lock
+                raise httpx.ConnectError("github down")
+            retry_started.set()
+            await finish_retry.wait()
+            return response
+        mock_request.side_effect = request
+
+        skill = AromaticOracleSkill()
+        url = "https://github.com/user/repo"
+        first = asyncio.ensure_future(skill._fetch_repo_data(url))
+        waiter = asyncio.ensure_future(skill._fetch_repo_data(url))
+        with self.assertRaises(httpx.ConnectError):
+            await first
+        await retry_started.wait()
+        # Arrives while the waiter is retrying the failed fetch
+        late = asyncio.ensure_future(skill._fetch_repo_data(url))
+        await asyncio.sleep(0)
+        finish_retry.set()
+        results = await asyncio.gather(waiter, late)
+
+        self.assertEqual(results, [{"size": 100}] * 2)
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertFalse(skill._repo_locks)
+
+    @patch("aura_pheromone.skill.AromaticOracleSkill._request_repo_data")
+    async def test_fetch_repo_data_revalidates_with_etag(self, mock_request):
+        fresh = MagicMock(status_code=200, content=b'{"size": 100}', headers={"ETag": '"abc"', "Cache-Control": "max-age=0"})
+        not_modified = MagicMock(status_code=304, content=b"", headers={"Cache-Control": "max-age=60"})
+        mock_request.side_effect = [fresh, not_modified]
+
+        skill = AromaticOracleSkill()
+        await skill._fetch_repo_data("https://github.com/user/repo")
+        result = await skill._fetch_repo_data("https://github.com/user/repo")
+
+        self.assertEqual(result, {"size": 100})
+        self.assertEqual(mock_request.call_args.kwargs["etag"], '"abc"')
+
+    @patch("aura_pheromone.skill.AromaticOracleSkill._emit_pheromone")
+    async def test_failed_background_pheromone_is_logged(self, mock_emit):
+        mock_emit.side_effect = RuntimeError("moltbook down")
+        skill = AromaticOracleSkill()
+
+        with self.assertLogs("aura_pheromone.skill", level="ERROR"):
+            skill._schedule_pheromone("report")
+            await skill.flush()
+        self.assertFalse(skill._pending)
+
+    def test_parse_repo_requires_a_github_url(self):
+        self.assertEqual(_parse_repo("https://www.github.com/user/repo?tab=readme")[:2], ("user", "repo"))
+        self.assertEqual(_parse_repo("HTTPS://GitHub.com/User/Repo")[:2], ("User", "Repo"))
+        for url in ("https://example.com/github.com/user/repo", "ftp://github.com/user/repo"):
+            with self.assertRaises(ValueError):
+                _parse_repo(url)
+
+    def test_score_batch_matches_scalar_appraisal(self):
+        repo_datas = [{"stargazers_count": 5, "size": 100}, {"stargazers_count": 500, "size": 0}, {}]
+        surge_values = AromaticOracleSkill.score_batch(repo_datas, [9.5, 5.5, 5.5])
+
+        # Complexity 0.6 clamps to 1, 50 clamps to 10 and a missing repo counts as 0
+        expected = [(9.5 / 10) * 0.618 * 100 + 10, (5.5 / 10) * 0.618 * 100 + 100, (5.5 / 10) * 0.618 * 100 + 10]
+        for value, want in zip(surge_values, expected):
+            self.assertAlmostEqual(value, want)
+
+    async def test_injected_http_client_is_shared_by_synapses(self):
+        http = MagicMock()
+        skill = AromaticOracleSkill(http_client=http)
+
+        self.assertIs(await skill.metabolism._get_client(), http)
+        self.assertIs(await skill.moltbook._get_client(), http)
+        await skill.aclose()
+        http.aclose.assert_not_called()
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,27 @@
+import asyncio
+import unittest
+from aura_pheromone.transport import SharedAsyncClient
+
+class TestSharedAsyncClient(unittest.TestCase):
+    def test_client_is_reused_within_a_loop(self):
+        pool = SharedAsyncClient()
+
+        async def get_twice():
+            first, second = await pool.get(), await pool.get()
+            await pool.aclose()
+            return first, second
+
+        first, second = asyncio.run(get_twice())
+        self.assertIs(first, second)
+        self.assertTrue(first.is_closed)
+
+    def test_client_is_rebuilt_for_a_new_loop(self):
+        pool = SharedAsyncClient()
+        first = asyncio.run(pool.get())
+        second = asyncio.run(pool.get())
+
+        self.assertIsNot(first, second)
+        asyncio.run(pool.aclose())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import AsyncMock, patch
+from aura_pheromone.vision import VisionCortex
+
+class TestVisionCortex(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        # Healthy vitals by default; tests override the return value or the skill's generate
+        ping = patch("aura_pheromone.vision.VisionCortex.ping", return_value={"status": "VITALS_STATUS_OK"})
+        self.mock_ping = ping.start()
+        self.addCleanup(ping.stop)
+        self.cortex = VisionCortex()
+        self.cortex.skill = AsyncMock()
+        self.cortex._initialized = True
+
+    async def _fail_until_open(self):
+        self.cortex.skill.generate.side_effect = TimeoutError("tunnel degraded")
+        for _ in range(VisionCortex.CIRCUIT_FAILURE_THRESHOLD):
+            with self.assertRaises(TimeoutError):
+                await self.cortex.verify_asset("img")
+
+    async def test_healthy_vitals_are_cached(self):
+        self.cortex.skill.generate.return_value = {"make": "Honda"}
+
+        await self.cortex.verify_asset("img-1")
+        await self.cortex.verify_asset("img-2")
+
+        self.assertEqual(self.mock_ping.call_count, 1)
+
+    async def test_perception_failure_forces_a_new_ping(self):
+        self.cortex.skill.generate.side_effect = [{"error": "model unloaded"}, {"make": "Honda"}]
+
+        with self.assertRaises(ValueError):
+            await self.cortex.verify_asset("img-1")
+        await self.cortex.verify_asset("img-2")
+
+        self.assertEqual(self.mock_ping.call_count, 2)
+
+    async def test_verify_assets_checks_vitals_once(self):
+        self.cortex.skill.generate.side_effect = lambda images: {"image": images[0]}
+
+        results = await self.cortex.verify_assets(["img-1", "img-2", "img-3"])
+
+        self.assertEqual([r["image"] for r in results], ["img-1", "img-2", "img-3"])
+        self.assertEqual(self.mock_ping.call_count, 1)
+
+    async def test_verify_assets_keeps_results_when_one_image_fails(self):
+        self.cortex.skill.generate.side_effect = [{"make": "Honda"}, {"error": "blurry"}]
+
+        results = await self.cortex.verify_assets(["img-1", "img-2"])
+
+        self.assertEqual(results[0], {"make": "Honda"})
+        self.assertIsInstance(results[1], ValueError)
+
+    async def test_verify_assets_caps_concurrent_perceptions(self):
+        in_flight = peak = 0
+
+        async def generate(images):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"image": images[0]}
+        self.cortex.skill.generate.side_effect = generate
+
+        results = await self.cortex.verify_assets([f"img-{i}" for i in range(10)])
+
+        self.assertEqual(len(results), 10)
+        self.assertEqual(peak, VisionCortex.MAX_CONCURRENT_PERCEPTIONS)
+
+    async def test_repeated_failures_open_the_circuit(self):
+        await self._fail_until_open()
+        with self.assertRaisesRegex(ConnectionError, "circuit open"):
+            await self.cortex.verify_asset("img")
+
+        # The open circuit fails fast: no further ping or generate
+        self.assertEqual(self.cortex.skill.generate.call_count, VisionCortex.CIRCUIT_FAILURE_THRESHOLD)
+        self.assertEqual(self.mock_ping.call_count, VisionCortex.CIRCUIT_FAILURE_THRESHOLD)
+
+    async def test_error_results_do_not_open_the_circuit(self):
+        garbage = [{"error": "garbage image"}] * VisionCortex.CIRCUIT_FAILURE_THRESHOLD
+        self.cortex.skill.generate.side_effect = garbage + [{"make": "Honda"}]
+
+        for _ in range(VisionCortex.CIRCUIT_FAILURE_THRESHOLD):
+            with self.assertRaises(ValueError):
+                await self.cortex.verify_asset("garbage")
+
+        self.assertEqual(await self.cortex.verify_asset("img"), {"make": "Honda"})
+
+    async def test_uninitialized_cortex_pings_even_with_fresh_vitals(self):
+        self.cortex._initialized = False
+        self.cortex.skill.generate.return_value = {"make": "Honda"}
+        # e.g. a timestamp that looks fresh only because the host booted moments ago
+        self.cortex._last_vitals_ok_at = time.monotonic()
+
+        await self.cortex.verify_asset("img")
+
+        self.mock_ping.assert_called_once()
+
+    async def test_circuit_reopens_on_first_failure_after_cooldown(self):
+        await self._fail_until_open()
+
+        self.cortex._open_until = 0  # cooldown elapsed
+        with self.assertRaises(TimeoutError):
+            await self.cortex.verify_asset("img")
+        with self.assertRaisesRegex(ConnectionError, "circuit open"):
+            await self.cortex.verify_asset("img")
+
+    async def test_failed_heartbeats_open_the_circuit(self):
+        self.mock_ping.return_value = {"status": "VITALS_STATUS_ERROR", "error": "timed out"}
+
+        for _ in range(VisionCortex.CIRCUIT_FAILURE_THRESHOLD):
+            with self.assertRaisesRegex(ConnectionError, "inactive"):
+                await self.cortex.verify_asset("img")
+        with self.assertRaisesRegex(ConnectionError, "circuit open"):
+            await self.cortex.verify_asset("img")
+
+        self.assertEqual(self.mock_ping.call_count, VisionCortex.CIRCUIT_FAILURE_THRESHOLD)
+
+if __name__ == "__main__":
+    unittest.main()